@@ -12,17 +12,29 @@ These endpoints are critical for:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Response, status
+from fastapi.responses import ORJSONResponse
 
 from app.services.cache import get_cache_service
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
+# Per-dependency deadline for readiness checks (seconds)
+HEALTH_CHECK_TIMEOUT = 0.5
+
+# How long a successful readiness result is reused (seconds)
+READINESS_CACHE_TTL = 0.5
+_readiness_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+_readiness_lock = asyncio.Lock()
+
 
 class HealthStatus(str, Enum):
     """Health check status values."""
@@ -32,6 +44,19 @@ class HealthStatus(str, Enum):
     DEGRADED = "degraded"
 
 
+async def _check_redis() -> bool:
+    """Check Redis connectivity."""
+    cache = await get_cache_service()
+    return await cache.health_check()
+
+
+# Readiness dependencies as (name, check, required)
+# Redis is optional - the app can function without cache
+DEPENDENCY_CHECKS: List[Tuple[str, Callable[[], Awaitable[bool]], bool]] = [
+    ("redis", _check_redis, False),
+]
+
+
 @router.get(
     "/healthz",
     summary="Liveness probe",
@@ -54,44 +79,41 @@ async def liveness() -> Dict[str, str]:
     return {"status": HealthStatus.HEALTHY}
 
 
-@router.get(
-    "/readyz",
-    summary="Readiness probe",
-    description="Returns 200 if the application is ready to receive traffic.",
-    responses={
-        200: {"description": "Application is ready to receive traffic"},
-        503: {"description": "Application is not ready"},
-    },
-)
-async def readiness(response: Response) -> Dict[str, Any]:
-    """
-    Readiness probe endpoint.
-
-    Checks all dependencies (Redis, databases, etc.) to determine
-    if the application can handle requests.
-
-    Kubernetes will stop routing traffic if this probe fails.
-    """
+async def _check_dependencies() -> Dict[str, Any]:
+    """Run all readiness dependency checks and aggregate their status."""
     checks: Dict[str, Dict[str, Any]] = {}
     overall_healthy = True
 
-    # Check Redis
-    try:
-        cache = await get_cache_service()
-        redis_healthy = await cache.health_check()
-        checks["redis"] = {
-            "status": HealthStatus.HEALTHY if redis_healthy else HealthStatus.UNHEALTHY,
-            "required": False,  # App can function without cache
-        }
-        if not redis_healthy:
-            logger.warning("Redis health check failed")
-    except Exception as e:
-        checks["redis"] = {
-            "status": HealthStatus.UNHEALTHY,
-            "error": str(e),
-            "required": False,
-        }
-        logger.warning(f"Redis health check error: {e}")
+    # Run all dependency checks concurrently, each under its own deadline,
+    # so probe latency tracks the slowest dependency rather than the sum
+    results = await asyncio.gather(
+        *(
+            asyncio.wait_for(check(), timeout=HEALTH_CHECK_TIMEOUT)
+            for _, check, _ in DEPENDENCY_CHECKS
+        ),
+        return_exceptions=True,
+    )
+
+    for (name, _, required), result in zip(DEPENDENCY_CHECKS, results, strict=True):
+        if isinstance(result, BaseException):
+            error = (
+                f"Health check timed out after {HEALTH_CHECK_TIMEOUT}s"
+                if isinstance(result, asyncio.TimeoutError)
+                else str(result)
+            )
+            checks[name] = {
+                "status": HealthStatus.UNHEALTHY,
+                "error": error,
+                "required": required,
+            }
+            logger.warning("%s health check error: %s", name, error)
+        else:
+            checks[name] = {
+                "status": HealthStatus.HEALTHY if result else HealthStatus.UNHEALTHY,
+                "required": required,
+            }
+            if not result:
+                logger.warning("%s health check failed", name)
 
     # Determine overall status
     # Only fail readiness for required dependencies
@@ -102,7 +124,6 @@ async def readiness(response: Response) -> Dict[str, Any]:
 
     if required_unhealthy:
         overall_healthy = False
-        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
 
     # Check if any non-required services are unhealthy (degraded state)
     any_unhealthy = any(
@@ -121,6 +142,49 @@ async def readiness(response: Response) -> Dict[str, Any]:
     }
 
 
+@router.get(
+    "/readyz",
+    summary="Readiness probe",
+    description="Returns 200 if the application is ready to receive traffic.",
+    responses={
+        200: {"description": "Application is ready to receive traffic"},
+        503: {"description": "Application is not ready"},
+    },
+)
+async def readiness(response: Response) -> Dict[str, Any]:
+    """
+    Readiness probe endpoint.
+
+    Checks all dependencies (Redis, databases, etc.) to determine
+    if the application can handle requests.
+
+    Kubernetes will stop routing traffic if this probe fails.
+    """
+    global _readiness_cache
+
+    # Serve a recent successful result to absorb probe storms
+    cached = _readiness_cache
+    if cached is not None and time.monotonic() - cached[0] < READINESS_CACHE_TTL:
+        return cached[1]
+
+    async with _readiness_lock:
+        # Another request may have refreshed the result while we waited
+        cached = _readiness_cache
+        if cached is not None and time.monotonic() - cached[0] < READINESS_CACHE_TTL:
+            return cached[1]
+
+        result = await _check_dependencies()
+
+        if result["status"] == HealthStatus.UNHEALTHY:
+            # Never cache failures so they propagate immediately
+            _readiness_cache = None
+            response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        else:
+            _readiness_cache = (time.monotonic(), result)
+
+        return result
+
+
 @router.get(
     "/health",
     summary="Detailed health check",
@@ -2,36 +2,50 @@
 
 Exposes application metrics in Prometheus format for:
 - Request latency histograms
-- Request counters by endpoint and status
+- Request counters by endpoint and status class
 - Active connections gauge
 - Custom business metrics
 """
 
 import logging
+import re
 import time
-from collections.abc import Callable
-from typing import Any
-
-from fastapi import APIRouter, Request, Response
-from prometheus_client import (
-    CONTENT_TYPE_LATEST,
-    Counter,
-    Gauge,
-    Histogram,
-    generate_latest,
-)
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.routing import Match
+from collections.abc import Sequence
+from typing import Any, Optional
+
+from prometheus_client import Counter, Gauge, Histogram, make_asgi_app
+from prometheus_client.metrics import MetricWrapperBase
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+
+def _status_class(status_code: int) -> str:
+    """Collapse a status code into its class label (e.g., 404 -> "4xx")."""
+    return f"{status_code // 100}xx"
+
+
+def _status_code(status_code: int) -> str:
+    """Use the raw status code as the label value."""
+    return str(status_code)
+
+
+# Status codes are bucketed into classes by default to cap series cardinality;
+# METRICS_DETAILED_STATUS restores the raw code. Chosen once at import so the
+# middleware has no per-request branch.
+if settings.metrics_detailed_status:
+    STATUS_LABEL, status_label_value = "status_code", _status_code
+else:
+    STATUS_LABEL, status_label_value = "status_class", _status_class
 
 # Define metrics
 REQUEST_COUNT = Counter(
     "http_requests_total",
     "Total HTTP requests",
-    ["method", "endpoint", "status_code"],
+    ["method", "endpoint", STATUS_LABEL],
 )
 
 REQUEST_LATENCY = Histogram(
@@ -71,75 +85,145 @@ ITEMS_DELETED = Counter(
 )
 
 
-def get_path_template(request: Request) -> str:
-    """Get the path template for the request (e.g., /api/v1/items/{item_id})."""
-    for route in request.app.routes:
-        match, _ = route.matches(request.scope)
-        if match == Match.FULL:
-            return route.path
-    return request.url.path
+ROUTE_CACHE_SIZE = 4096
+CHILD_CACHE_SIZE = 2048
+
+# Endpoint label for requests that match no route, so unknown paths
+# (scanners, typos) collapse into a single series
+UNMATCHED_ENDPOINT = "__unmatched__"
 
+# (compiled path regex, path template, allowed methods or None for any)
+RouteIndex = list[tuple[re.Pattern[str], str, Optional[frozenset[str]]]]
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    """Middleware to collect request metrics."""
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Any]
-    ) -> Response:
-        # Skip metrics endpoint to avoid recursion
-        if request.url.path == "/metrics":
-            return await call_next(request)
+def build_route_index(routes: Sequence[BaseRoute]) -> RouteIndex:
+    """Precompute the (pattern, template, methods) table used for matching."""
+    index: RouteIndex = []
+    for route in routes:
+        path_regex = getattr(route, "path_regex", None)
+        template = getattr(route, "path", None)
+        if path_regex is None or template is None:
+            continue
+        methods = getattr(route, "methods", None)
+        index.append((path_regex, template, frozenset(methods) if methods else None))
+    return index
 
-        method = request.method
-        path = get_path_template(request)
+
+def get_path_template(index: RouteIndex, method: str, path: str) -> str:
+    """Get the path template for the request (e.g., /api/v1/items/{item_id})."""
+    for pattern, template, methods in index:
+        if (methods is None or method in methods) and pattern.match(path):
+            return template
+    return UNMATCHED_ENDPOINT
+
+
+def _cached_child(
+    cache: dict[tuple[Any, ...], Any],
+    metric: MetricWrapperBase,
+    key: tuple[Any, ...],
+) -> Any:
+    """Return the labelled child of ``metric`` for ``key``, memoized in ``cache``."""
+    child = cache.get(key)
+    if child is None:
+        child = metric.labels(*key)
+        if len(cache) >= CHILD_CACHE_SIZE:
+            # Evict the oldest entry to keep the cache bounded
+            del cache[next(iter(cache))]
+        cache[key] = child
+    return child
+
+
+class MetricsMiddleware:
+    """Middleware to collect request metrics.
+
+    Pure ASGI implementation: the status code is captured from the
+    ``http.response.start`` message. Route templates are resolved against a
+    route index compiled on the first request and memoized per
+    ``(method, path)``.
+    Labelled metric children are cached as well, skipping the per-call
+    ``.labels()`` lock and lookup on the hot path.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._route_index: Optional[RouteIndex] = None
+        self._route_cache: dict[tuple[str, str], str] = {}
+        self._count_children: dict[tuple[Any, ...], Any] = {}
+        self._latency_children: dict[tuple[Any, ...], Any] = {}
+        self._inprog_children: dict[tuple[Any, ...], Any] = {}
+
+    def _resolve_path(self, scope: Scope) -> str:
+        key = (scope["method"], scope["path"])
+        path = self._route_cache.get(key)
+        if path is None:
+            if self._route_index is None:
+                # Routes are only reachable through the scope once serving
+                self._route_index = build_route_index(scope["app"].routes)
+            path = get_path_template(self._route_index, *key)
+            if len(self._route_cache) >= ROUTE_CACHE_SIZE:
+                # Evict the oldest entry to keep the cache bounded
+                del self._route_cache[next(iter(self._route_cache))]
+            self._route_cache[key] = path
+        return path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Skip non-HTTP traffic and the metrics endpoint to avoid recursion
+        if scope["type"] != "http" or scope["path"] == "/metrics":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = self._resolve_path(scope)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         # Track in-progress requests
-        REQUESTS_IN_PROGRESS.labels(method=method, endpoint=path).inc()
+        in_progress = _cached_child(
+            self._inprog_children, REQUESTS_IN_PROGRESS, (method, path)
+        )
+        in_progress.inc()
 
-        start_time = time.perf_counter()
+        start_time = time.perf_counter_ns()
         try:
-            response = await call_next(request)
-            status_code = response.status_code
-        except Exception:
-            status_code = 500
-            raise
+            await self.app(scope, receive, send_wrapper)
         finally:
             # Record metrics
-            duration = time.perf_counter() - start_time
+            duration = (time.perf_counter_ns() - start_time) / 1_000_000_000
 
-            REQUEST_COUNT.labels(
-                method=method,
-                endpoint=path,
-                status_code=status_code,
+            _cached_child(
+                self._count_children,
+                REQUEST_COUNT,
+                (method, path, status_label_value(status_code)),
             ).inc()
 
-            REQUEST_LATENCY.labels(
-                method=method,
-                endpoint=path,
+            _cached_child(
+                self._latency_children, REQUEST_LATENCY, (method, path)
             ).observe(duration)
 
-            REQUESTS_IN_PROGRESS.labels(method=method, endpoint=path).dec()
+            in_progress.dec()
 
-        return response
 
+class MetricsApp:
+    """Prometheus exposition endpoint as a plain ASGI app.
 
-@router.get(
-    "/metrics",
-    summary="Prometheus metrics",
-    description="Exposes application metrics in Prometheus format",
-    response_class=Response,
-    include_in_schema=False,
-)
-async def metrics() -> Response:
+    Routed at /metrics directly rather than through a FastAPI endpoint, so
+    scrapes skip request parsing and dependency resolution. Wrapped in a class
+    because Starlette only treats non-function endpoints as raw ASGI apps.
     """
-    Prometheus metrics endpoint.
 
-    Returns metrics in Prometheus exposition format for scraping.
-    """
-    return Response(
-        content=generate_latest(),
-        media_type=CONTENT_TYPE_LATEST,
-    )
+    def __init__(self) -> None:
+        self._app = make_asgi_app()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self._app(scope, receive, send)
+
+
+metrics_app = MetricsApp()
 
 
 # Helper functions for recording business metrics
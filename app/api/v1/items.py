@@ -6,16 +6,21 @@ Demonstrates production patterns:
 - Cache-aside pattern with Redis
 - Proper error handling
 - Pagination support
+- ETag-based conditional GET for item lists
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import time
 import uuid
 from datetime import datetime
-from typing import Any, Optional, List
+from itertools import islice
+from typing import Any, Optional, List, Tuple
 
-from fastapi import APIRouter, HTTPException, Query, Response, status
+from fastapi import APIRouter, Header, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from app.api.metrics import (
@@ -24,20 +29,32 @@ from app.api.metrics import (
     record_item_created,
     record_item_deleted,
 )
-from app.services.cache import get_cache_service
+from app.services.cache import CacheService, get_cache_service
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
 # Cache settings
 CACHE_PREFIX = "item:"
 CACHE_TTL = 3600  # 1 hour
 ITEMS_LIST_KEY = "items:list"
+LIST_CACHE_TTL = 60  # 1 minute
 
 # In-memory storage (would be a database in production)
 from typing import Dict
 _items_db: Dict[str, Dict[str, Any]] = {}
 
+# Rendered JSON body per item, kept in step with _items_db so reads and list
+# pages reuse bodies validated once at write time
+_item_bodies: Dict[str, str] = {}
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") for _utc_now_iso
+_iso_prefix: Tuple[int, str] = (-1, "")
+
+# Version token embedded in list page cache keys. Replaced on every write so
+# stale pages are never read again and simply expire.
+_list_version: str = uuid.uuid4().hex
+
 
 # Pydantic models
 class ItemCreate(BaseModel):
@@ -99,33 +116,96 @@ class ItemListResponse(BaseModel):
     total_pages: int
 
 
+def _utc_now_iso() -> str:
+    """Current UTC time in ISO 8601 format with millisecond precision.
+
+    The formatted date/time prefix is cached per second, so most calls only
+    format the millisecond suffix instead of building a datetime.
+    """
+    global _iso_prefix
+    now = time.time()
+    second = int(now)
+    if _iso_prefix[0] != second:
+        _iso_prefix = (
+            second,
+            time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)),
+        )
+    return f"{_iso_prefix[1]}.{int((now - second) * 1000):03d}+00:00"
+
+
 def _get_cache_key(item_id: str) -> str:
     """Generate cache key for an item."""
     return f"{CACHE_PREFIX}{item_id}"
 
 
-async def _get_from_cache(item_id: str) -> Optional[Dict[str, Any]]:
-    """Get item from cache."""
-    cache = await get_cache_service()
+def _render_item(item: Dict[str, Any]) -> str:
+    """Validate and serialize an item to its JSON response body.
+
+    The rendered body is both cached and returned as-is, so each item is
+    validated and encoded once instead of on every response.
+    """
+    return ItemResponse.model_validate(item).model_dump_json()
+
+
+def _render_list(
+    item_bodies: List[str], total: int, page: int, page_size: int, total_pages: int
+) -> str:
+    """Assemble an ItemListResponse body from pre-rendered item bodies.
+
+    Produces the same compact JSON as ``ItemListResponse.model_dump_json``
+    without re-validating or re-encoding any item.
+    """
+    return (
+        f'{{"items":[{",".join(item_bodies)}],"total":{total},"page":{page},'
+        f'"page_size":{page_size},"total_pages":{total_pages}}}'
+    )
+
+
+def _item_response(body: str, status_code: int = status.HTTP_200_OK) -> Response:
+    """Wrap a pre-rendered item body in a JSON response."""
+    return Response(
+        content=body, status_code=status_code, media_type="application/json"
+    )
+
+
+async def _get_from_cache(cache: CacheService, item_id: str) -> Optional[str]:
+    """Get pre-rendered item body from cache."""
     cached = await cache.get(_get_cache_key(item_id))
-    if cached:
+    # Entries written before bodies were pre-rendered are dicts; treat as a miss
+    if isinstance(cached, str):
         record_cache_hit("get_item")
         return cached
     record_cache_miss("get_item")
     return None
 
 
-async def _set_in_cache(item_id: str, item: Dict[str, Any]) -> None:
-    """Set item in cache."""
-    cache = await get_cache_service()
-    await cache.set(_get_cache_key(item_id), item, ttl=CACHE_TTL)
+async def _set_in_cache(cache: CacheService, item_id: str, body: str) -> None:
+    """Set pre-rendered item body in cache."""
+    await cache.set(_get_cache_key(item_id), body, ttl=CACHE_TTL)
 
 
-async def _delete_from_cache(item_id: str) -> None:
+async def _delete_from_cache(cache: CacheService, item_id: str) -> None:
     """Delete item from cache."""
-    cache = await get_cache_service()
     await cache.delete(_get_cache_key(item_id))
-    await cache.delete(ITEMS_LIST_KEY)
+    _invalidate_list_cache()
+
+
+def _get_list_cache_key(page: int, page_size: int) -> str:
+    """Generate cache key for a page of the item list."""
+    return f"{ITEMS_LIST_KEY}:{_list_version}:{page}:{page_size}"
+
+
+def _invalidate_list_cache() -> None:
+    """Invalidate all cached list pages by rotating the version token."""
+    global _list_version
+    _list_version = uuid.uuid4().hex
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    return any(tag.strip() in (etag, "*") for tag in if_none_match.split(","))
 
 
 @router.post(
@@ -134,7 +214,7 @@ async def _delete_from_cache(item_id: str) -> None:
     status_code=status.HTTP_201_CREATED,
     summary="Create a new item",
 )
-async def create_item(item: ItemCreate) -> ItemResponse:
+async def create_item(item: ItemCreate) -> Response:
     """
     Create a new item.
 
@@ -145,31 +225,32 @@ async def create_item(item: ItemCreate) -> ItemResponse:
     - **tags**: List of tags
     """
     item_id = str(uuid.uuid4())
-    now = datetime.utcnow()
+    now = _utc_now_iso()
 
     item_data = {
         "id": item_id,
         **item.model_dump(),
-        "created_at": now.isoformat(),
-        "updated_at": now.isoformat(),
+        "created_at": now,
+        "updated_at": now,
     }
 
     # Store in database
     _items_db[item_id] = item_data
+    body = _item_bodies[item_id] = _render_item(item_data)
 
     # Cache the new item
-    await _set_in_cache(item_id, item_data)
+    cache = await get_cache_service()
+    await _set_in_cache(cache, item_id, body)
 
     # Invalidate list cache
-    cache = await get_cache_service()
-    await cache.delete(ITEMS_LIST_KEY)
+    _invalidate_list_cache()
 
     # Record metric
     record_item_created()
 
-    logger.info(f"Created item: {item_id}", extra={"item_id": item_id})
+    logger.info("Created item: %s", item_id, extra={"item_id": item_id})
 
-    return ItemResponse(**item_data)
+    return _item_response(body, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -180,32 +261,46 @@ async def create_item(item: ItemCreate) -> ItemResponse:
 async def list_items(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
-) -> ItemListResponse:
+    if_none_match: Optional[str] = Header(None),
+) -> Response:
     """
     List all items with pagination.
 
     - **page**: Page number (default: 1)
     - **page_size**: Items per page (default: 10, max: 100)
+
+    Responses carry an ETag; a matching If-None-Match returns 304.
     """
-    # Get all items
-    all_items = list(_items_db.values())
-    total = len(all_items)
-
-    # Calculate pagination
-    total_pages = (total + page_size - 1) // page_size if total > 0 else 1
-    start = (page - 1) * page_size
-    end = start + page_size
-
-    # Get page items
-    page_items = all_items[start:end]
-
-    return ItemListResponse(
-        items=[ItemResponse(**item) for item in page_items],
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
-    )
+    cache = await get_cache_service()
+    cache_key = _get_list_cache_key(page, page_size)
+
+    cached = await cache.get(cache_key)
+    if cached:
+        record_cache_hit("list_items")
+        body, etag = cached["body"], cached["etag"]
+    else:
+        record_cache_miss("list_items")
+        total = len(_items_db)
+
+        # Calculate pagination
+        total_pages = (total + page_size - 1) // page_size if total > 0 else 1
+        start = (page - 1) * page_size
+        end = start + page_size
+
+        # Get page items without materializing the whole collection
+        page_bodies = list(islice(_item_bodies.values(), start, end))
+
+        body = _render_list(page_bodies, total, page, page_size, total_pages)
+        etag = f'"{hashlib.blake2b(body.encode(), digest_size=16).hexdigest()}"'
+
+        await cache.set(cache_key, {"body": body, "etag": etag}, ttl=LIST_CACHE_TTL)
+
+    if _etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.get(
@@ -213,7 +308,7 @@ async def list_items(
     response_model=ItemResponse,
     summary="Get an item by ID",
 )
-async def get_item(item_id: str) -> ItemResponse:
+async def get_item(item_id: str) -> Response:
     """
     Get a specific item by ID.
 
@@ -222,23 +317,23 @@ async def get_item(item_id: str) -> ItemResponse:
     2. If miss, fetch from database and cache
     """
     # Try cache first
-    cached = await _get_from_cache(item_id)
+    cache = await get_cache_service()
+    cached = await _get_from_cache(cache, item_id)
     if cached:
-        return ItemResponse(**cached)
+        return _item_response(cached)
 
     # Cache miss - get from database
-    if item_id not in _items_db:
+    body = _item_bodies.get(item_id)
+    if body is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Item {item_id} not found",
         )
 
-    item_data = _items_db[item_id]
-
     # Cache for next time
-    await _set_in_cache(item_id, item_data)
+    await _set_in_cache(cache, item_id, body)
 
-    return ItemResponse(**item_data)
+    return _item_response(body)
 
 
 @router.put(
@@ -246,40 +341,41 @@ async def get_item(item_id: str) -> ItemResponse:
     response_model=ItemResponse,
     summary="Update an item",
 )
-async def update_item(item_id: str, item: ItemUpdate) -> ItemResponse:
+async def update_item(item_id: str, item: ItemUpdate) -> Response:
     """
     Update an existing item.
 
     Only provided fields will be updated (partial update).
     """
-    if item_id not in _items_db:
+    item_data = _items_db.get(item_id)
+    if item_data is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Item {item_id} not found",
         )
 
     # Update fields
-    item_data = _items_db[item_id]
     update_data = item.model_dump(exclude_unset=True)
 
     for field, value in update_data.items():
         item_data[field] = value
 
-    item_data["updated_at"] = datetime.utcnow().isoformat()
+    item_data["updated_at"] = _utc_now_iso()
 
     # Update database
     _items_db[item_id] = item_data
+    body = _item_bodies[item_id] = _render_item(item_data)
 
     # Update cache
-    await _set_in_cache(item_id, item_data)
+    cache = await get_cache_service()
+    await _set_in_cache(cache, item_id, body)
 
     # Invalidate list cache
-    cache = await get_cache_service()
-    await cache.delete(ITEMS_LIST_KEY)
+    _invalidate_list_cache()
 
-    logger.info(f"Updated item: {item_id}", extra={"item_id": item_id})
+    logger.info("Updated item: %s", item_id, extra={"item_id": item_id})
 
-    return ItemResponse(**item_data)
+    return _item_response(body)
 
 
 @router.delete(
@@ -293,21 +389,21 @@ async def delete_item(item_id: str) -> Response:
 
     Removes from both database and cache.
     """
-    if item_id not in _items_db:
+    # Delete from database
+    if _items_db.pop(item_id, None) is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Item {item_id} not found",
         )
-
-    # Delete from database
-    del _items_db[item_id]
+    _item_bodies.pop(item_id, None)
 
     # Delete from cache
-    await _delete_from_cache(item_id)
+    cache = await get_cache_service()
+    await _delete_from_cache(cache, item_id)
 
     # Record metric
     record_item_deleted()
 
-    logger.info(f"Deleted item: {item_id}", extra={"item_id": item_id})
+    logger.info("Deleted item: %s", item_id, extra={"item_id": item_id})
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
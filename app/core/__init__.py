@@ -1,6 +1,6 @@
 """Core application configuration and utilities."""
 
-from app.core.config import settings
+from app.core.config import IS_DEV, IS_PROD, settings
 from app.core.logging import setup_logging
 
-__all__ = ["settings", "setup_logging"]
+__all__ = ["IS_DEV", "IS_PROD", "settings", "setup_logging"]
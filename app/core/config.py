@@ -11,10 +11,14 @@ from __future__ import annotations
 from functools import lru_cache
 from typing import Literal, List
 
-from pydantic import Field, RedisDsn
+from pydantic import Field, RedisDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+# Upper bound for the Redis connection pool, whatever REDIS_POOL_SIZE says
+REDIS_MAX_POOL_SIZE = 100
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
@@ -40,8 +44,10 @@ class Settings(BaseSettings):
 
     # Redis
     redis_url: RedisDsn = Field(default="redis://localhost:6379/0")
-    redis_pool_size: int = Field(default=10)
+    redis_pool_size: int = Field(default=10, ge=1)
     redis_timeout: int = Field(default=5)
+    # Seconds a Redis health check result is reused (0 disables caching)
+    redis_healthcheck_ttl: float = Field(default=0.5, ge=0)
 
     # Logging
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
@@ -51,11 +57,20 @@ class Settings(BaseSettings):
 
     # Metrics
     metrics_enabled: bool = Field(default=True)
+    # Label requests with the raw status code instead of its class (2xx, 4xx...).
+    # Multiplies the number of http_requests_total series, so it is opt-in.
+    metrics_detailed_status: bool = Field(default=False)
 
     # Security
     allowed_hosts: List[str] = Field(default=["*"])
     cors_origins: List[str] = Field(default=["*"])
 
+    @field_validator("redis_pool_size")
+    @classmethod
+    def clamp_redis_pool_size(cls, value: int) -> int:
+        """Cap the pool so load spikes cannot open unbounded connections."""
+        return min(value, REDIS_MAX_POOL_SIZE)
+
     @property
     def is_production(self) -> bool:
         """Check if running in production environment."""
@@ -74,3 +89,7 @@ def get_settings() -> Settings:
 
 
 settings = get_settings()
+
+# Environment flags evaluated once at import for use on hot paths
+IS_PROD: bool = settings.is_production
+IS_DEV: bool = settings.is_development
@@ -10,6 +10,7 @@ import logging
 import sys
 from typing import Any, Dict
 
+import orjson
 from pythonjsonlogger import jsonlogger
 
 from app.core.config import settings
@@ -18,6 +19,11 @@ from app.core.config import settings
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
     """Custom JSON formatter with additional fields."""
 
+    # Settings snapshot read on every record; refreshed by setup_logging()
+    _env: str = settings.environment
+    _svc: str = settings.app_name
+    _dbg: bool = settings.debug
+
     def add_fields(
         self,
         log_record: Dict[str, Any],
@@ -30,14 +36,18 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
         log_record["timestamp"] = self.formatTime(record)
         log_record["level"] = record.levelname
         log_record["logger"] = record.name
-        log_record["environment"] = settings.environment
-        log_record["service"] = settings.app_name
+        log_record["environment"] = self._env
+        log_record["service"] = self._svc
 
         # Add location info for debugging
-        if settings.debug:
+        if self._dbg:
             log_record["location"] = f"{record.pathname}:{record.lineno}"
             log_record["function"] = record.funcName
 
+    def jsonify_log_record(self, log_record: Dict[str, Any]) -> str:
+        """Serialize the log record with orjson (much faster than stdlib json)."""
+        return orjson.dumps(log_record, default=str).decode()
+
 
 def setup_logging() -> None:
     """Configure application logging based on settings."""
@@ -54,6 +64,9 @@ def setup_logging() -> None:
 
     if settings.log_format == "json":
         # JSON format for production
+        CustomJsonFormatter._env = settings.environment
+        CustomJsonFormatter._svc = settings.app_name
+        CustomJsonFormatter._dbg = settings.debug
         formatter = CustomJsonFormatter(
             "%(timestamp)s %(level)s %(name)s %(message)s",
         )
@@ -15,14 +15,13 @@ from typing import AsyncGenerator, Dict, Any
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from fastapi.responses import ORJSONResponse
 
 from app import __version__
 from app.api import health, metrics
 from app.api.metrics import MetricsMiddleware
 from app.api.v1 import items
-from app.core.config import settings
+from app.core.config import IS_DEV, settings
 from app.core.logging import setup_logging
 from app.middleware.request_id import RequestIDMiddleware
 from app.services.cache import close_cache, init_cache
@@ -61,27 +60,34 @@ def create_app() -> FastAPI:
         title=settings.app_name,
         version=__version__,
         description="Production-ready FastAPI deployment pipeline demonstrating DevOps best practices",
-        docs_url="/docs" if settings.is_development else None,
-        redoc_url="/redoc" if settings.is_development else None,
-        openapi_url="/openapi.json" if settings.is_development else None,
+        docs_url="/docs" if IS_DEV else None,
+        redoc_url="/redoc" if IS_DEV else None,
+        openapi_url="/openapi.json" if IS_DEV else None,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Add middleware (order matters - first added is outermost)
+    # Only install what this deployment uses: every layer runs on every request
     app.add_middleware(RequestIDMiddleware)
-    app.add_middleware(MetricsMiddleware)
-
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=settings.cors_origins,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+
+    # Internal-only deployments can disable CORS entirely with CORS_ORIGINS=[]
+    if settings.cors_origins:
+        # Credentials are not allowed with a wildcard origin (CORS spec), and
+        # disabling them keeps Starlette on its static-header fast path
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=settings.cors_origins,
+            allow_credentials="*" not in settings.cors_origins,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
 
     # Register routers
     app.include_router(health.router, tags=["Health"])
-    app.include_router(metrics.router, tags=["Metrics"])
+    app.add_route("/metrics", metrics.metrics_app, include_in_schema=False)
     app.include_router(items.router, prefix="/api/v1", tags=["Items"])
 
     # Root endpoint
@@ -91,7 +97,7 @@ def create_app() -> FastAPI:
             "service": settings.app_name,
             "version": __version__,
             "environment": settings.environment,
-            "docs": "/docs" if settings.is_development else "disabled",
+            "docs": "/docs" if IS_DEV else "disabled",
         }
 
     return app
@@ -107,7 +113,7 @@ if __name__ == "__main__":
         "app.main:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.is_development,
-        workers=settings.workers if not settings.is_development else 1,
+        reload=IS_DEV,
+        workers=settings.workers if not IS_DEV else 1,
         log_level=settings.log_level.lower(),
     )
@@ -2,16 +2,18 @@
 
 Adds a unique request ID to each request for traceability across services.
 Supports incoming X-Request-ID headers for distributed tracing.
+
+Implemented as a pure ASGI middleware: it reads headers straight from the
+ASGI scope and appends response headers on ``http.response.start``, avoiding
+the extra task and Request/Response objects of ``BaseHTTPMiddleware``.
 """
 
+import logging
 import time
 import uuid
-from collections.abc import Callable
 from contextvars import ContextVar
-from typing import Any
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.logging import get_logger
 
@@ -26,52 +28,70 @@ def get_request_id() -> str:
     return request_id_ctx.get()
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """Middleware that adds request ID and timing to each request."""
 
-    HEADER_NAME = "X-Request-ID"
-
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Any]
-    ) -> Response:
-        # Get or generate request ID
-        request_id = request.headers.get(self.HEADER_NAME) or str(uuid.uuid4())
+    HEADER_NAME = b"x-request-id"
+    RESPONSE_TIME_HEADER = b"x-response-time"
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Get or generate request ID, reusing the incoming header bytes as-is
+        request_id_bytes = b""
+        for name, value in scope["headers"]:
+            if name == self.HEADER_NAME:
+                request_id_bytes = value
+                break
+        if request_id_bytes:
+            request_id = request_id_bytes.decode("latin-1")
+        else:
+            request_id = uuid.uuid4().hex
+            request_id_bytes = request_id.encode("latin-1")
         request_id_ctx.set(request_id)
 
         # Record start time
-        start_time = time.perf_counter()
-
-        # Log request
-        logger.info(
-            "Request started",
-            extra={
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "client_ip": request.client.host if request.client else "unknown",
-            },
-        )
-
-        # Process request
-        response: Response = await call_next(request)
-
-        # Calculate duration
-        duration_ms = (time.perf_counter() - start_time) * 1000
-
-        # Add headers to response
-        response.headers[self.HEADER_NAME] = request_id
-        response.headers["X-Response-Time"] = f"{duration_ms:.2f}ms"
-
-        # Log response
-        logger.info(
-            "Request completed",
-            extra={
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
-                "duration_ms": round(duration_ms, 2),
-            },
-        )
-
-        return response
+        start_time = time.perf_counter_ns()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Request started",
+                extra={
+                    "request_id": request_id,
+                    "method": scope["method"],
+                    "path": scope["path"],
+                },
+            )
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate duration
+                duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
+
+                # Add headers to response
+                headers = list(message.get("headers", []))
+                headers.append((self.HEADER_NAME, request_id_bytes))
+                headers.append(
+                    (self.RESPONSE_TIME_HEADER, f"{duration_ms:.2f}ms".encode())
+                )
+                message["headers"] = headers
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Request completed",
+                        extra={
+                            "request_id": request_id,
+                            "method": scope["method"],
+                            "path": scope["path"],
+                            "status_code": message["status"],
+                            "duration_ms": round(duration_ms, 2),
+                        },
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,26 +1,163 @@
 """Redis cache service with connection pooling and error handling.
 
 Provides a robust caching layer with:
-- Connection pooling for performance
+- Bounded, blocking connection pooling for performance and backpressure
+- One process-wide pool that outlives individual client handles, rebuilt
+  if it belongs to another event loop
+- Batched multi-key operations (one round trip per batch)
+- Non-blocking deletes (UNLINK), including by key pattern
 - Automatic reconnection on failure
-- JSON serialization for complex objects
+- Compact MessagePack serialization, LZ4-compressed for large values
 - Health check support
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-from typing import Any, Optional
+import time
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
 
+import lz4.frame
+import msgpack
 import redis.asyncio as redis
-from redis.asyncio.connection import ConnectionPool
+from redis.asyncio.connection import BlockingConnectionPool, ConnectionPool
+from redis.exceptions import ConnectionError as RedisConnectionError
 from redis.exceptions import RedisError
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Prefix for every key written by this service. Bump it whenever the value
+# format changes so entries written in an older format are never misread.
+KEY_PREFIX = "v2:"
+
+# Packed values larger than this (bytes) are LZ4-compressed
+COMPRESSION_THRESHOLD = 1024
+
+# One-byte format marker prepended to every stored value
+_RAW = b"\x00"
+_LZ4 = b"\x01"
+
+_DECODE_ERRORS = (ValueError, RuntimeError, msgpack.UnpackException)
+
+# Keys requested per SCAN call and unlinked per command in delete_pattern
+SCAN_BATCH_SIZE = 500
+
+# Seconds a pooled connection may sit idle before it is PINGed on checkout
+HEALTH_CHECK_INTERVAL = 30
+
+# Process-wide connection pool and the event loop its connections belong to.
+# Created on first connect and closed by shutdown_pool() so reconnects reuse
+# warm sockets; connect() replaces it if the event loop has changed.
+_pool: Optional[ConnectionPool] = None
+_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _pack_default(obj: Any) -> Any:
+    """Encode types MessagePack does not support natively."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+def _serialize(value: Any) -> bytes:
+    """Pack a value with MessagePack, compressing it when large."""
+    packed = msgpack.packb(value, use_bin_type=True, default=_pack_default)
+    if len(packed) > COMPRESSION_THRESHOLD:
+        return _LZ4 + lz4.frame.compress(packed)
+    return _RAW + packed
+
+
+def _deserialize(data: bytes) -> Any:
+    """Reverse :func:`_serialize`."""
+    marker, payload = data[:1], data[1:]
+    if marker == _LZ4:
+        payload = lz4.frame.decompress(payload)
+    elif marker != _RAW:
+        raise ValueError(f"Unknown cache value format: {marker!r}")
+    return msgpack.unpackb(payload, raw=False)
+
+
+def _key(key: str) -> str:
+    """Namespace a cache key with the current format prefix."""
+    return f"{KEY_PREFIX}{key}"
+
+
+class _BlockingConnectionPool(BlockingConnectionPool):
+    """BlockingConnectionPool that connects outside its condition lock.
+
+    In redis 5.0.1 the stock get_connection() holds the pool's condition while
+    connecting, and a failed connect releases the connection by re-acquiring
+    that same condition. The call stalls for the full timeout and the slot is
+    never returned. Here only slot checkout happens under the lock.
+    """
+
+    async def get_connection(self, _command_name, *_keys, **_options):
+        """Wait for a free slot, then connect without holding the lock."""
+        try:
+            async with asyncio.timeout(self.timeout):
+                async with self._condition:
+                    await self._condition.wait_for(self.can_get_connection)
+                    try:
+                        connection = self._available_connections.pop()
+                    except IndexError:
+                        connection = self.make_connection()
+                    self._in_use_connections.add(connection)
+        except TimeoutError as err:
+            raise RedisConnectionError("No connection available.") from err
+
+        try:
+            await self.ensure_connection(connection)
+        except BaseException:
+            await self.release(connection)
+            raise
+        return connection
+
+
+def _get_pool() -> ConnectionPool:
+    """Return the shared connection pool, creating it on first use.
+
+    A pool created on a different event loop (whose sockets cannot be used
+    from this one) is discarded and rebuilt. Connections still checked out of
+    a discarded pool are released back to it by their callers and closed when
+    it is garbage collected.
+    """
+    global _pool, _pool_loop
+    loop = asyncio.get_running_loop()
+    if _pool is not None and _pool_loop is not loop:
+        logger.warning("Replacing Redis connection pool from another event loop")
+        _pool = None
+    if _pool is None:
+        # Blocking pool: once all connections are busy, callers wait up to
+        # redis_timeout for one instead of failing with "Too many connections"
+        _pool = _BlockingConnectionPool.from_url(
+            str(settings.redis_url),
+            max_connections=settings.redis_pool_size,
+            timeout=settings.redis_timeout,
+            # Values are binary MessagePack, so never decode replies
+            decode_responses=False,
+            socket_timeout=settings.redis_timeout,
+            socket_connect_timeout=settings.redis_timeout,
+            health_check_interval=HEALTH_CHECK_INTERVAL,
+        )
+        _pool_loop = loop
+    return _pool
+
+
+async def shutdown_pool() -> None:
+    """Close every connection in the shared pool."""
+    global _pool, _pool_loop
+    if _pool is not None:
+        await _pool.disconnect()
+        _pool = None
+        _pool_loop = None
+
 
 class CacheService:
     """Redis cache service with connection management."""
@@ -28,18 +165,16 @@ class CacheService:
     def __init__(self) -> None:
         self._pool: Optional[ConnectionPool] = None
         self._client: Optional[redis.Redis] = None
+        # Last health check result and when it was taken (monotonic seconds)
+        self._hc_ts: float = 0.0
+        self._hc_val: bool = False
 
     async def connect(self) -> None:
-        """Initialize Redis connection pool."""
+        """Create a client handle on the shared connection pool."""
         try:
-            self._pool = ConnectionPool.from_url(
-                str(settings.redis_url),
-                max_connections=settings.redis_pool_size,
-                decode_responses=True,
-                socket_timeout=settings.redis_timeout,
-                socket_connect_timeout=settings.redis_timeout,
-            )
+            self._pool = _get_pool()
             self._client = redis.Redis(connection_pool=self._pool)
+            self._hc_ts = 0.0
             # Verify connection
             await self._client.ping()
             logger.info("Redis connection established")
@@ -48,36 +183,48 @@ class CacheService:
             raise
 
     async def disconnect(self) -> None:
-        """Close Redis connection pool."""
+        """Close the client handle, leaving the shared pool open."""
         if self._client:
             await self._client.aclose()
             self._client = None
-        if self._pool:
-            await self._pool.disconnect()
-            self._pool = None
+        self._pool = None
         logger.info("Redis connection closed")
 
     async def health_check(self) -> bool:
-        """Check Redis connection health."""
+        """Check Redis connection health.
+
+        The PING result is reused for ``redis_healthcheck_ttl`` seconds so
+        frequent probes do not each cost a round trip.
+        """
         if not self._client:
             return False
+        now = time.monotonic()
+        if now - self._hc_ts < settings.redis_healthcheck_ttl:
+            return self._hc_val
         try:
             await self._client.ping()
-            return True
+            healthy = True
         except RedisError:
-            return False
+            healthy = False
+        self._hc_ts, self._hc_val = now, healthy
+        return healthy
 
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
-        if not self._client:
+        client = self._client
+        if client is None:
             return None
         try:
-            value = await self._client.get(key)
-            if value:
-                return json.loads(value)
+            value = await client.get(_key(key))
+        except RedisError as e:
+            logger.warning("Cache get failed for key %s: %s", key, e)
             return None
-        except (RedisError, json.JSONDecodeError) as e:
-            logger.warning(f"Cache get failed for key {key}: {e}")
+        if not value:
+            return None
+        try:
+            return _deserialize(value)
+        except _DECODE_ERRORS as e:
+            logger.warning("Cache get failed for key %s: %s", key, e)
             return None
 
     async def set(
@@ -87,36 +234,138 @@ class CacheService:
         ttl: Optional[int] = None,
     ) -> bool:
         """Set value in cache with optional TTL."""
-        if not self._client:
+        client = self._client
+        if client is None:
+            return False
+        try:
+            serialized = _serialize(value)
+        except TypeError as e:
+            logger.warning("Cache set failed for key %s: %s", key, e)
             return False
         try:
-            serialized = json.dumps(value)
             if ttl:
-                await self._client.setex(key, ttl, serialized)
+                await client.setex(_key(key), ttl, serialized)
             else:
-                await self._client.set(key, serialized)
+                await client.set(_key(key), serialized)
+        except RedisError as e:
+            logger.warning("Cache set failed for key %s: %s", key, e)
+            return False
+        return True
+
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get multiple values in one round trip (None for misses)."""
+        client = self._client
+        if client is None or not keys:
+            return [None] * len(keys)
+        try:
+            values = await client.mget([_key(key) for key in keys])
+        except RedisError as e:
+            logger.warning("Cache mget failed for %d keys: %s", len(keys), e)
+            return [None] * len(keys)
+
+        results: List[Optional[Any]] = []
+        for key, value in zip(keys, values, strict=True):
+            try:
+                results.append(_deserialize(value) if value else None)
+            except _DECODE_ERRORS as e:
+                logger.warning("Cache get failed for key %s: %s", key, e)
+                results.append(None)
+        return results
+
+    async def mset(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[int] = None,
+    ) -> bool:
+        """Set multiple values in one round trip with optional TTL."""
+        client = self._client
+        if client is None:
+            return False
+        if not mapping:
             return True
-        except (RedisError, TypeError) as e:
-            logger.warning(f"Cache set failed for key {key}: {e}")
+        try:
+            serialized = {
+                _key(key): _serialize(value) for key, value in mapping.items()
+            }
+        except TypeError as e:
+            logger.warning("Cache mset failed for %d keys: %s", len(mapping), e)
+            return False
+        try:
+            if ttl:
+                # MSET has no expiry option; pipeline SETs with EX instead
+                async with client.pipeline(transaction=False) as pipe:
+                    for key, value in serialized.items():
+                        pipe.set(key, value, ex=ttl)
+                    await pipe.execute()
+            else:
+                await client.mset(serialized)
+        except RedisError as e:
+            logger.warning("Cache mset failed for %d keys: %s", len(mapping), e)
             return False
+        return True
 
     async def delete(self, key: str) -> bool:
-        """Delete value from cache."""
-        if not self._client:
+        """Delete value from cache.
+
+        Uses UNLINK so Redis reclaims the memory in a background thread
+        instead of blocking on large values.
+        """
+        client = self._client
+        if client is None:
             return False
         try:
-            await self._client.delete(key)
+            await client.unlink(_key(key))
+        except RedisError as e:
+            logger.warning("Cache delete failed for key %s: %s", key, e)
+            return False
+        return True
+
+    async def mdelete(self, keys: List[str]) -> bool:
+        """Delete multiple values with a single command."""
+        client = self._client
+        if client is None:
+            return False
+        if not keys:
             return True
+        try:
+            await client.unlink(*(_key(key) for key in keys))
+        except RedisError as e:
+            logger.warning("Cache mdelete failed for %d keys: %s", len(keys), e)
+            return False
+        return True
+
+    async def delete_pattern(self, pattern: str) -> bool:
+        """Delete every key matching a glob pattern.
+
+        Keys are found with incremental SCAN (never KEYS) and unlinked in
+        batches of ``SCAN_BATCH_SIZE``.
+        """
+        client = self._client
+        if client is None:
+            return False
+        try:
+            batch: List[bytes] = []
+            async for key in client.scan_iter(
+                match=_key(pattern), count=SCAN_BATCH_SIZE
+            ):
+                batch.append(key)
+                if len(batch) >= SCAN_BATCH_SIZE:
+                    await client.unlink(*batch)
+                    batch.clear()
+            if batch:
+                await client.unlink(*batch)
         except RedisError as e:
-            logger.warning(f"Cache delete failed for key {key}: {e}")
+            logger.warning("Cache delete_pattern failed for %s: %s", pattern, e)
             return False
+        return True
 
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
-        if not self._client:
+        client = self._client
+        if client is None:
             return False
         try:
-            return bool(await self._client.exists(key))
+            return bool(await client.exists(_key(key)))
         except RedisError:
             return False
 
@@ -141,8 +390,9 @@ async def init_cache() -> CacheService:
 
 
 async def close_cache() -> None:
-    """Close the cache service connection."""
+    """Close the cache service connection and the shared pool."""
     global _cache_service
     if _cache_service:
         await _cache_service.disconnect()
         _cache_service = None
+    await shutdown_pool()
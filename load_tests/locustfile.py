@@ -24,12 +24,16 @@ Usage:
            --tags smoke --headless -u 10 -r 2 -t 1m
 """
 
-import json
+import os
 import random
 import string
+from collections import deque
+from itertools import cycle
 from typing import Any
 
-from locust import HttpUser, between, events, tag, task
+import gevent
+import orjson
+from locust import FastHttpUser, HttpUser, between, events, tag, task
 
 
 def generate_random_string(length: int = 10) -> str:
@@ -48,6 +52,40 @@ def generate_item_data() -> dict[str, Any]:
     }
 
 
+def generate_update_data() -> dict[str, Any]:
+    """Generate random partial update data for PUT requests."""
+    return {
+        "name": f"Updated Item {generate_random_string(5)}",
+        "price": round(random.uniform(1.0, 1000.0), 2),
+    }
+
+
+# Stats names that aggregate requests for different item IDs into one entry
+ITEMS_NAME = "/api/v1/items"
+ITEM_NAME = "/api/v1/items/[id]"
+
+# Pre-encoded request bodies, built once at import so tasks spend no CPU on
+# random string generation or JSON encoding
+PAYLOAD_POOL_SIZE = 1024
+JSON_HEADERS = {"content-type": "application/json"}
+_CREATE_BODIES = [orjson.dumps(generate_item_data()) for _ in range(PAYLOAD_POOL_SIZE)]
+_UPDATE_BODIES = [
+    orjson.dumps(generate_update_data()) for _ in range(PAYLOAD_POOL_SIZE)
+]
+
+# Query parameters for list requests and pre-drawn spike burst sizes
+PAGE_SIZES = (10, 20, 50)
+_BURST_SIZES = cycle([random.randint(5, 20) for _ in range(256)])
+
+
+def list_items_page(client: Any, rng: random.Random) -> None:
+    """Request a random page of items, reported under a single stats entry."""
+    page = rng.randrange(1, 6)
+    page_size = rng.choice(PAGE_SIZES)
+
+    client.get(f"/api/v1/items?page={page}&page_size={page_size}", name=ITEMS_NAME)
+
+
 class FastAPIUser(HttpUser):
     """
     Simulates a typical user interacting with the FastAPI application.
@@ -61,8 +99,16 @@ class FastAPIUser(HttpUser):
     # Wait time between tasks (simulates user think time)
     wait_time = between(1, 3)
 
-    # Store created item IDs for later operations
-    created_items: list[str] = []
+    # Maximum number of created item IDs remembered per user
+    max_tracked_items = 100
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Per-user store of created item IDs for later operations; the oldest
+        # IDs are dropped automatically once the limit is reached
+        self.created_items: deque[str] = deque(maxlen=self.max_tracked_items)
+        # Independent per-user generator, seeded so users do not move in step
+        self._rng = random.Random(os.urandom(8))
 
     def on_start(self) -> None:
         """Called when a user starts - verify API is available."""
@@ -112,19 +158,21 @@ class FastAPIUser(HttpUser):
     @task(2)
     def create_item(self) -> None:
         """Create a new item."""
-        item_data = generate_item_data()
+        self._post_item(self._rng.choice(_CREATE_BODIES))
 
+    def _post_item(self, body: bytes) -> None:
+        """POST a pre-encoded item body and remember the created ID."""
         with self.client.post(
             "/api/v1/items",
-            json=item_data,
+            data=body,
+            headers=JSON_HEADERS,
+            name=ITEMS_NAME,
             catch_response=True,
         ) as response:
             if response.status_code == 201:
-                item_id = response.json().get("id")
+                item_id = orjson.loads(response.content).get("id")
                 if item_id:
-                    # Store for later operations (limit to prevent memory issues)
-                    if len(self.created_items) < 100:
-                        self.created_items.append(item_id)
+                    self.created_items.append(item_id)
                 response.success()
             else:
                 response.failure(f"Create failed: {response.status_code}")
@@ -133,62 +181,66 @@ class FastAPIUser(HttpUser):
     @task(10)  # Higher weight - reads are more common
     def list_items(self) -> None:
         """List items with pagination."""
-        page = random.randint(1, 5)
-        page_size = random.choice([10, 20, 50])
-
-        self.client.get(f"/api/v1/items?page={page}&page_size={page_size}")
+        list_items_page(self.client, self._rng)
 
     @tag("load", "items", "read")
     @task(5)
     def get_item(self) -> None:
         """Get a specific item by ID."""
-        if self.created_items:
-            item_id = random.choice(self.created_items)
-            with self.client.get(
-                f"/api/v1/items/{item_id}",
-                catch_response=True,
-            ) as response:
-                if response.status_code in [200, 404]:  # 404 is valid if item was deleted
-                    response.success()
-                else:
-                    response.failure(f"Get item failed: {response.status_code}")
+        items = self.created_items
+        if not items:
+            return
+        item_id = items[self._rng.randrange(len(items))]
+
+        with self.client.get(
+            f"/api/v1/items/{item_id}",
+            name=ITEM_NAME,
+            catch_response=True,
+        ) as response:
+            if response.status_code in [200, 404]:  # 404 is valid if item was deleted
+                response.success()
+            else:
+                response.failure(f"Get item failed: {response.status_code}")
 
     @tag("load", "items", "update")
     @task(2)
     def update_item(self) -> None:
         """Update an existing item."""
-        if self.created_items:
-            item_id = random.choice(self.created_items)
-            update_data = {
-                "name": f"Updated Item {generate_random_string(5)}",
-                "price": round(random.uniform(1.0, 1000.0), 2),
-            }
-
-            with self.client.put(
-                f"/api/v1/items/{item_id}",
-                json=update_data,
-                catch_response=True,
-            ) as response:
-                if response.status_code in [200, 404]:
-                    response.success()
-                else:
-                    response.failure(f"Update failed: {response.status_code}")
+        items = self.created_items
+        if not items:
+            return
+        item_id = items[self._rng.randrange(len(items))]
+
+        with self.client.put(
+            f"/api/v1/items/{item_id}",
+            data=self._rng.choice(_UPDATE_BODIES),
+            headers=JSON_HEADERS,
+            name=ITEM_NAME,
+            catch_response=True,
+        ) as response:
+            if response.status_code in [200, 404]:
+                response.success()
+            else:
+                response.failure(f"Update failed: {response.status_code}")
 
     @tag("load", "items", "delete")
     @task(1)  # Lower weight - deletes are less common
     def delete_item(self) -> None:
         """Delete an existing item."""
-        if self.created_items:
-            item_id = self.created_items.pop(0)  # Remove from our list
-
-            with self.client.delete(
-                f"/api/v1/items/{item_id}",
-                catch_response=True,
-            ) as response:
-                if response.status_code in [204, 404]:
-                    response.success()
-                else:
-                    response.failure(f"Delete failed: {response.status_code}")
+        items = self.created_items
+        if not items:
+            return
+        item_id = items.popleft()  # Remove from our list
+
+        with self.client.delete(
+            f"/api/v1/items/{item_id}",
+            name=ITEM_NAME,
+            catch_response=True,
+        ) as response:
+            if response.status_code in [204, 404]:
+                response.success()
+            else:
+                response.failure(f"Delete failed: {response.status_code}")
 
 
 class StressTestUser(FastAPIUser):
@@ -207,8 +259,8 @@ class StressTestUser(FastAPIUser):
     @task(5)
     def burst_create(self) -> None:
         """Rapidly create items to stress the system."""
-        for _ in range(5):
-            self.create_item()
+        for body in self._rng.sample(_CREATE_BODIES, 5):
+            self._post_item(body)
 
     @tag("stress", "burst")
     @task(3)
@@ -218,22 +270,43 @@ class StressTestUser(FastAPIUser):
             self.list_items()
 
 
-class SpikeTestUser(FastAPIUser):
+class SpikeTestUser(FastHttpUser):
     """
     User for spike testing - sudden bursts of traffic.
+
+    Characteristics:
+        - geventhttpclient-based client (lower CPU per request)
+        - Each burst is sent concurrently, not one request at a time
     """
 
     wait_time = between(0.1, 0.3)
 
+    # Connections per user; enough for a full burst of health + list requests
+    concurrency = 40
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._rng = random.Random(os.urandom(8))
+
+    def on_start(self) -> None:
+        """Called when a user starts - verify API is available."""
+        response = self.client.get("/healthz")
+        if response.status_code != 200:
+            raise Exception("API health check failed")
+
+    def list_items(self) -> None:
+        """List a random page of items."""
+        list_items_page(self.client, self._rng)
+
     @tag("spike")
     @task
     def spike_traffic(self) -> None:
         """Generate spike traffic pattern."""
-        # Random burst of requests
-        burst_size = random.randint(5, 20)
-        for _ in range(burst_size):
-            self.client.get("/healthz")
-            self.list_items()
+        # Random burst of requests, all in flight at once
+        burst_size = next(_BURST_SIZES)
+        jobs = [gevent.spawn(self.client.get, "/healthz") for _ in range(burst_size)]
+        jobs += [gevent.spawn(self.list_items) for _ in range(burst_size)]
+        gevent.joinall(jobs)
 
 
 # =============================================================================
@@ -1,13 +1,15 @@
 """Pytest configuration and fixtures.
 
 Provides shared test fixtures for:
-- FastAPI test client
+- FastAPI test client (shared across the session)
+- Shared Prometheus metrics scrape
 - Mock Redis service
 - Test data factories
 """
 
 import asyncio
 from collections.abc import AsyncGenerator, Generator
+from contextlib import ExitStack
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -15,6 +17,8 @@ import pytest
 from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
 
+from app.api import health
+from app.api.v1 import items
 from app.main import app
 from app.services.cache import CacheService
 
@@ -27,29 +31,90 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop.close()
 
 
-@pytest.fixture
-def mock_cache_service() -> MagicMock:
-    """Create a mock cache service."""
-    mock = MagicMock(spec=CacheService)
+@pytest.fixture(autouse=True)
+def reset_readiness_cache() -> Generator[None, None, None]:
+    """Clear the cached readiness result so each test probes dependencies."""
+    health._readiness_cache = None
+    yield
+    health._readiness_cache = None
+
+
+def _configure_cache_mock(mock: MagicMock) -> None:
+    """Install default behaviour on a mock cache service."""
     mock.health_check = AsyncMock(return_value=True)
     mock.get = AsyncMock(return_value=None)
     mock.set = AsyncMock(return_value=True)
     mock.delete = AsyncMock(return_value=True)
     mock.exists = AsyncMock(return_value=False)
+
+
+@pytest.fixture(scope="session")
+def mock_cache_service() -> MagicMock:
+    """Create a mock cache service shared by the whole session."""
+    mock = MagicMock(spec=CacheService)
+    _configure_cache_mock(mock)
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def reset_app_state(mock_cache_service: MagicMock) -> None:
+    """Restore in-memory state mutated by earlier tests.
+
+    The client and cache mock are session-scoped, so each test starts
+    from an empty item store and a freshly configured cache mock.
+    """
+    items._items_db.clear()
+    items._item_bodies.clear()
+    items._invalidate_list_cache()
+    _configure_cache_mock(mock_cache_service)
+
+
+def _patch_cache(stack: ExitStack, mock_cache_service: MagicMock) -> None:
+    """Patch the cache service lifecycle for the lifetime of ``stack``."""
+    stack.enter_context(
+        patch(
+            "app.services.cache.get_cache_service",
+            return_value=mock_cache_service,
+        )
+    )
+    stack.enter_context(patch("app.services.cache.init_cache", new_callable=AsyncMock))
+    stack.enter_context(patch("app.services.cache.close_cache", new_callable=AsyncMock))
+
+
+@pytest.fixture(scope="session")
 def client(mock_cache_service: MagicMock) -> Generator[TestClient, None, None]:
     """Create a test client with mocked dependencies."""
-    with patch(
-        "app.services.cache.get_cache_service",
-        return_value=mock_cache_service,
-    ):
-        with patch("app.services.cache.init_cache", new_callable=AsyncMock):
-            with patch("app.services.cache.close_cache", new_callable=AsyncMock):
-                with TestClient(app) as test_client:
-                    yield test_client
+    with ExitStack() as stack:
+        _patch_cache(stack, mock_cache_service)
+        yield stack.enter_context(TestClient(app))
+
+
+@pytest.fixture(scope="session")
+def warm_metrics(client: TestClient) -> None:
+    """Record one GET /healthz so labelled request series exist."""
+    client.get("/healthz")
+
+
+@pytest.fixture(scope="session")
+def metrics_body(client: TestClient, warm_metrics: None) -> bytes:
+    """Raw body of a /metrics scrape taken once per session."""
+    return client.get("/metrics").content
+
+
+@pytest.fixture(scope="session")
+def metric_names(metrics_body: bytes) -> frozenset[str]:
+    """Metric and sample names in the shared scrape, collected in one pass.
+
+    Declared names come from ``# TYPE`` lines, so labelled metrics that have
+    not been observed yet are included.
+    """
+    names: set[str] = set()
+    for line in metrics_body.decode("ascii").splitlines():
+        if line.startswith("# TYPE "):
+            names.add(line.split(" ", 3)[2])
+        elif line and not line.startswith("#"):
+            names.add(line.split(" ", 1)[0].split("{", 1)[0])
+    return frozenset(names)
 
 
 @pytest.fixture
@@ -57,17 +122,13 @@ async def async_client(
     mock_cache_service: MagicMock,
 ) -> AsyncGenerator[AsyncClient, None]:
     """Create an async test client."""
-    with patch(
-        "app.services.cache.get_cache_service",
-        return_value=mock_cache_service,
-    ):
-        with patch("app.services.cache.init_cache", new_callable=AsyncMock):
-            with patch("app.services.cache.close_cache", new_callable=AsyncMock):
-                async with AsyncClient(
-                    transport=ASGITransport(app=app),
-                    base_url="http://test",
-                ) as ac:
-                    yield ac
+    with ExitStack() as stack:
+        _patch_cache(stack, mock_cache_service)
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test",
+        ) as ac:
+            yield ac
 
 
 @pytest.fixture
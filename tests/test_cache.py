@@ -0,0 +1,338 @@
+"""Tests for the Redis cache service.
+
+Tests cover:
+- Serialization round trips
+- Batched multi-key operations
+- Health check caching
+- Graceful degradation without a connection
+"""
+
+import asyncio
+import fnmatch
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import msgpack
+import pytest
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.services import cache as cache_module
+from app.services.cache import COMPRESSION_THRESHOLD, SCAN_BATCH_SIZE, CacheService
+
+
+class FakePipeline:
+    """Minimal stand-in for a redis.asyncio pipeline."""
+
+    def __init__(self, store: dict[str, bytes]) -> None:
+        self.store = store
+        self.commands: list[tuple[str, bytes]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    def set(self, key: str, value: bytes, ex: int | None = None) -> None:
+        self.commands.append((key, value))
+
+    async def execute(self) -> list[bool]:
+        for key, value in self.commands:
+            self.store[key] = value
+        return [True] * len(self.commands)
+
+
+@pytest.fixture
+def redis_client() -> MagicMock:
+    """Create a mock Redis client backed by an in-memory dict."""
+    store: dict[str, bytes] = {}
+    client = MagicMock()
+
+    async def _set(key: str, value: bytes) -> bool:
+        store[key] = value
+        return True
+
+    async def _setex(key: str, ttl: int, value: bytes) -> bool:
+        store[key] = value
+        return True
+
+    async def _mset(mapping: dict[str, bytes]) -> bool:
+        store.update(mapping)
+        return True
+
+    async def _unlink(*keys: str) -> int:
+        return sum(store.pop(key, None) is not None for key in keys)
+
+    async def _scan_iter(match: str, count: int) -> AsyncIterator[str]:
+        for key in [k for k in store if fnmatch.fnmatchcase(k, match)]:
+            yield key
+
+    client.get = AsyncMock(side_effect=lambda key: store.get(key))
+    client.mget = AsyncMock(side_effect=lambda keys: [store.get(k) for k in keys])
+    client.set = AsyncMock(side_effect=_set)
+    client.setex = AsyncMock(side_effect=_setex)
+    client.mset = AsyncMock(side_effect=_mset)
+    client.unlink = AsyncMock(side_effect=_unlink)
+    client.scan_iter = MagicMock(side_effect=_scan_iter)
+    client.pipeline = MagicMock(side_effect=lambda **_: FakePipeline(store))
+    client.store = store
+    return client
+
+
+@pytest.fixture
+def cache(redis_client: MagicMock) -> CacheService:
+    """Create a cache service wired to the mock Redis client."""
+    service = CacheService()
+    service._client = redis_client
+    return service
+
+
+class TestCacheSerialization:
+    """Tests for cache value serialization."""
+
+    async def test_set_stores_bytes(
+        self, cache: CacheService, redis_client: MagicMock
+    ) -> None:
+        """Test that small values are stored as uncompressed MessagePack."""
+        value: dict[str, Any] = {"name": "Widget", "tags": ["a", "b"]}
+
+        assert await cache.set("key", value) is True
+        assert redis_client.store["v2:key"] == b"\x00" + msgpack.packb(value)
+
+    async def test_large_values_are_compressed(
+        self, cache: CacheService, redis_client: MagicMock
+    ) -> None:
+        """Test that values above the threshold are LZ4-compressed."""
+        value = {"description": "x" * COMPRESSION_THRESHOLD * 4}
+
+        await cache.set("key", value)
+
+        stored = redis_client.store["v2:key"]
+        assert stored[:1] == b"\x01"
+        assert len(stored) < COMPRESSION_THRESHOLD
+        assert await cache.get("key") == value
+
+    async def test_round_trip(self, cache: CacheService) -> None:
+        """Test that a stored value is returned unchanged."""
+        value = {"name": "Widget", "price": 9.99, "tags": []}
+
+        await cache.set("key", value, ttl=60)
+
+        assert await cache.get("key") == value
+
+    async def test_set_unserializable_value(self, cache: CacheService) -> None:
+        """Test that unserializable values are rejected without raising."""
+        assert await cache.set("key", object()) is False
+
+    async def test_unprefixed_keys_are_ignored(
+        self, cache: CacheService, redis_client: MagicMock
+    ) -> None:
+        """Test that entries written in the old JSON format are not read."""
+        redis_client.store["key"] = b'{"name": "Widget"}'
+
+        assert await cache.get("key") is None
+
+    async def test_get_invalid_payload(
+        self, cache: CacheService, redis_client: MagicMock
+    ) -> None:
+        """Test that corrupt cache entries are treated as misses."""
+        redis_client.store["v2:key"] = b"\x07garbage"
+
+        assert await cache.get("key") is None
+
+
+class TestCacheBatchOperations:
+    """Tests for multi-key cache operations."""
+
+    async def test_mset_and_mget(
+        self, cache: CacheService, redis_client: MagicMock
+    ) -> None:
+        """Test that mset/mget round-trip values in a single call each."""
+        await cache.mset({"a": 1, "b": {"x": 2}})
+
+        assert await cache.mget(["a", "missing", "b"]) == [1, None, {"x": 2}]
+        redis_client.mget.assert_awaited_once()
+
+    async def test_mset_with_ttl_uses_pipeline(
+        self, cache: CacheService, redis_client: MagicMock
+    ) -> None:
+        """Test that TTL writes are batched through a pipeline."""
+        assert await cache.mset({"a": 1, "b": 2}, ttl=60) is True
+
+        redis_client.pipeline.assert_called_once_with(transaction=False)
+        redis_client.mset.assert_not_awaited()
+        assert await cache.mget(["a", "b"]) == [1, 2]
+
+    async def test_mdelete(self, cache: CacheService, redis_client: MagicMock) -> None:
+        """Test that mdelete removes all keys with one UNLINK."""
+        await cache.mset({"a": 1, "b": 2})
+
+        assert await cache.mdelete(["a", "b"]) is True
+        redis_client.unlink.assert_awaited_once_with("v2:a", "v2:b")
+        assert await cache.mget(["a", "b"]) == [None, None]
+
+    async def test_delete_pattern(
+        self, cache: CacheService, redis_client: MagicMock
+    ) -> None:
+        """Test that matching keys are unlinked in SCAN-sized batches."""
+        await cache.mset({f"items:{i}": i for i in range(SCAN_BATCH_SIZE + 1)})
+        await cache.set("other", 1)
+
+        assert await cache.delete_pattern("items:*") is True
+        redis_client.scan_iter.assert_called_once_with(
+            match="v2:items:*", count=SCAN_BATCH_SIZE
+        )
+        assert redis_client.unlink.await_count == 2
+        assert list(redis_client.store) == ["v2:other"]
+
+
+class TestCacheHealthCheck:
+    """Tests for the cached Redis health check."""
+
+    async def test_health_check_result_is_reused(
+        self, cache: CacheService, redis_client: MagicMock
+    ) -> None:
+        """Test that back-to-back health checks issue a single PING."""
+        redis_client.ping = AsyncMock(return_value=True)
+
+        assert await cache.health_check() is True
+        assert await cache.health_check() is True
+        redis_client.ping.assert_awaited_once()
+
+    async def test_health_check_reports_failure(
+        self, cache: CacheService, redis_client: MagicMock
+    ) -> None:
+        """Test that a failing PING is reported as unhealthy."""
+        redis_client.ping = AsyncMock(side_effect=RedisError("down"))
+
+        assert await cache.health_check() is False
+
+
+async def _connect_with_pool(pool: MagicMock) -> CacheService:
+    """Connect a CacheService with pool creation and the client mocked."""
+    client = MagicMock()
+    client.ping = AsyncMock(return_value=True)
+    with (
+        patch.object(
+            cache_module._BlockingConnectionPool, "from_url", return_value=pool
+        ),
+        patch.object(cache_module.redis, "Redis", return_value=client),
+    ):
+        service = CacheService()
+        await service.connect()
+    return service
+
+
+class TestCacheConnectionPool:
+    """Tests for the shared connection pool lifetime."""
+
+    async def test_reconnect_reuses_pool(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that disconnect keeps the pool and shutdown closes it."""
+        monkeypatch.setattr(cache_module, "_pool", None)
+        monkeypatch.setattr(cache_module, "_pool_loop", None)
+        pool = MagicMock()
+        pool.disconnect = AsyncMock()
+        client = MagicMock()
+        client.ping = AsyncMock(return_value=True)
+        client.aclose = AsyncMock()
+
+        with (
+            patch.object(
+                cache_module._BlockingConnectionPool, "from_url", return_value=pool
+            ) as from_url,
+            patch.object(cache_module.redis, "Redis", return_value=client),
+        ):
+            service = CacheService()
+            await service.connect()
+            await service.disconnect()
+            await service.connect()
+
+        from_url.assert_called_once()
+        pool.disconnect.assert_not_awaited()
+        # Replies stay raw bytes for the binary value format
+        assert from_url.call_args.kwargs["decode_responses"] is False
+
+        await cache_module.shutdown_pool()
+        pool.disconnect.assert_awaited_once()
+
+    async def test_pool_from_other_loop_is_replaced(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that connect rebuilds a pool created on another event loop."""
+        monkeypatch.setattr(cache_module, "_pool", MagicMock())
+        monkeypatch.setattr(cache_module, "_pool_loop", MagicMock())
+        fresh = MagicMock()
+
+        await _connect_with_pool(fresh)
+
+        assert cache_module._pool is fresh
+        assert cache_module._pool_loop is asyncio.get_running_loop()
+
+
+class TestCacheBlockingPool:
+    """Tests for waiting on a free connection slot."""
+
+    async def test_waits_for_released_connection(self) -> None:
+        """Test that a burst past the pool size waits instead of failing."""
+        pool = cache_module._BlockingConnectionPool(max_connections=1, timeout=1)
+        pool.ensure_connection = AsyncMock()
+        connection = await pool.get_connection("GET")
+
+        waiter = asyncio.create_task(pool.get_connection("GET"))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await pool.release(connection)
+        assert await waiter is connection
+
+    async def test_times_out_when_pool_stays_busy(self) -> None:
+        """Test that waiting is bounded by the pool timeout."""
+        pool = cache_module._BlockingConnectionPool(max_connections=1, timeout=0.01)
+        pool.ensure_connection = AsyncMock()
+        await pool.get_connection("GET")
+
+        with pytest.raises(RedisError, match="No connection available"):
+            await pool.get_connection("GET")
+
+
+class TestCacheRedisUnavailable:
+    """Tests for cache behavior when Redis refuses connections."""
+
+    async def test_refused_connection_fails_fast(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that failed connects return quickly and never leak pool slots."""
+        monkeypatch.setattr(cache_module, "_pool", None)
+        monkeypatch.setattr(cache_module, "_pool_loop", None)
+        monkeypatch.setattr(settings, "redis_url", "redis://127.0.0.1:1/0")
+        service = CacheService()
+
+        with pytest.raises(RedisError):
+            await service.connect()
+
+        start = time.perf_counter()
+        # More lookups than the pool has slots: a leaked slot would surface
+        # as a stall or a permanently exhausted pool
+        for _ in range(settings.redis_pool_size + 1):
+            assert await service.get("key") is None
+        elapsed = time.perf_counter() - start
+
+        pool = cache_module._pool
+        assert elapsed < 1
+        assert not pool._in_use_connections
+        await cache_module.shutdown_pool()
+
+
+class TestCacheWithoutConnection:
+    """Tests for cache behavior before connect() is called."""
+
+    async def test_get_returns_none(self) -> None:
+        """Test that get returns None when not connected."""
+        assert await CacheService().get("key") is None
+
+    async def test_set_returns_false(self) -> None:
+        """Test that set returns False when not connected."""
+        assert await CacheService().set("key", "value") is False
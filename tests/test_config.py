@@ -0,0 +1,27 @@
+"""Tests for application settings.
+
+Tests cover:
+- Redis pool size validation
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import REDIS_MAX_POOL_SIZE, Settings
+
+
+class TestRedisPoolSize:
+    """Tests for Redis pool size validation."""
+
+    def test_pool_size_is_capped(self) -> None:
+        """Test that oversized pools are clamped to the maximum."""
+        assert Settings(redis_pool_size=10_000).redis_pool_size == REDIS_MAX_POOL_SIZE
+
+    def test_pool_size_within_bounds_is_kept(self) -> None:
+        """Test that reasonable pool sizes are left unchanged."""
+        assert Settings(redis_pool_size=25).redis_pool_size == 25
+
+    def test_pool_size_must_be_positive(self) -> None:
+        """Test that a zero pool size is rejected."""
+        with pytest.raises(ValidationError):
+            Settings(redis_pool_size=0)
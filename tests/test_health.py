@@ -6,6 +6,7 @@ Tests cover:
 - Detailed health check (/health)
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -91,6 +92,45 @@ class TestReadinessProbe:
         data = response.json()
         assert "error" in data["checks"]["redis"]
 
+    def test_readiness_times_out_slow_dependency(
+        self, client: TestClient, mock_cache_service: MagicMock
+    ) -> None:
+        """Test readiness marks a hanging dependency unhealthy after the deadline."""
+
+        async def hang() -> bool:
+            await asyncio.sleep(1)
+            return True
+
+        mock_cache_service.health_check = hang
+
+        with patch(
+            "app.api.health.get_cache_service",
+            return_value=mock_cache_service,
+        ), patch("app.api.health.HEALTH_CHECK_TIMEOUT", 0.01):
+            response = client.get("/readyz")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "degraded"
+        assert data["checks"]["redis"]["status"] == "unhealthy"
+        assert "timed out" in data["checks"]["redis"]["error"]
+
+    def test_readiness_reuses_recent_result(
+        self, client: TestClient, mock_cache_service: MagicMock
+    ) -> None:
+        """Test that a successful readiness result is cached briefly."""
+        mock_cache_service.health_check = AsyncMock(return_value=True)
+
+        with patch(
+            "app.api.health.get_cache_service",
+            return_value=mock_cache_service,
+        ):
+            client.get("/readyz")
+            response = client.get("/readyz")
+
+        assert response.status_code == 200
+        assert mock_cache_service.health_check.await_count == 1
+
 
 class TestDetailedHealthCheck:
     """Tests for the detailed health check endpoint."""
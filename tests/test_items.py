@@ -8,10 +8,14 @@ Tests cover:
 """
 
 from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
+from app.api.v1 import items
+from app.api.v1.items import ItemListResponse
+
 
 class TestCreateItem:
     """Tests for item creation."""
@@ -34,6 +38,15 @@ class TestCreateItem:
         assert "created_at" in data
         assert "updated_at" in data
 
+    def test_create_item_timestamps_match(
+        self, client: TestClient, sample_item: dict[str, Any]
+    ) -> None:
+        """Test that a new item has identical created/updated timestamps."""
+        response = client.post("/api/v1/items", json=sample_item)
+        data = response.json()
+
+        assert data["created_at"] == data["updated_at"]
+
     def test_create_item_minimal(
         self, client: TestClient, sample_item_minimal: dict[str, Any]
     ) -> None:
@@ -95,6 +108,27 @@ class TestGetItem:
         assert response.status_code == 200
         assert response.json()["id"] == item_id
 
+    def test_get_item_served_from_cache(
+        self, client: TestClient, mock_cache_service: MagicMock
+    ) -> None:
+        """Test that a cached item body is returned without a database lookup."""
+        body = (
+            '{"id":"cached-id","name":"Cached","description":null,"price":1.0,'
+            '"quantity":0,"tags":[],"created_at":"2024-01-01T00:00:00Z",'
+            '"updated_at":"2024-01-01T00:00:00Z"}'
+        )
+        mock_cache_service.get = AsyncMock(return_value=body)
+
+        with patch(
+            "app.api.v1.items.get_cache_service",
+            return_value=mock_cache_service,
+        ):
+            response = client.get("/api/v1/items/cached-id")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["name"] == "Cached"
+
     def test_get_item_not_found(self, client: TestClient) -> None:
         """Test getting a non-existent item."""
         response = client.get("/api/v1/items/nonexistent-id")
@@ -137,6 +171,74 @@ class TestListItems:
         assert data["page"] == 1
         assert data["page_size"] == 2
 
+    def test_list_items_matches_response_model(
+        self, client: TestClient, sample_item: dict[str, Any]
+    ) -> None:
+        """Test that the assembled list body matches the response model."""
+        created = [
+            client.post("/api/v1/items", json={**sample_item, "name": f"Item {i}"})
+            for i in range(3)
+        ]
+
+        response = client.get("/api/v1/items?page=1&page_size=2")
+        expected = ItemListResponse(
+            items=[c.json() for c in created[:2]],
+            total=3,
+            page=1,
+            page_size=2,
+            total_pages=2,
+        )
+
+        assert response.content == expected.model_dump_json().encode()
+
+    def test_list_items_not_modified(
+        self, client: TestClient, sample_item: dict[str, Any]
+    ) -> None:
+        """Test that a matching If-None-Match returns 304 until items change."""
+        response = client.get("/api/v1/items")
+        etag = response.headers["etag"]
+
+        cached = client.get("/api/v1/items", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        client.post("/api/v1/items", json=sample_item)
+
+        changed = client.get("/api/v1/items", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+    def test_list_items_served_from_cache(
+        self,
+        client: TestClient,
+        mock_cache_service: MagicMock,
+        sample_item: dict[str, Any],
+    ) -> None:
+        """Test that a cached page is served until a write rotates its key."""
+        body = '{"items":[],"total":99,"page":1,"page_size":10,"total_pages":10}'
+        etag = '"cached-etag"'
+        old_key = items._get_list_cache_key(1, 10)
+        mock_cache_service.get = AsyncMock(
+            side_effect=lambda key: (
+                {"body": body, "etag": etag} if key == old_key else None
+            )
+        )
+
+        with patch(
+            "app.api.v1.items.get_cache_service",
+            return_value=mock_cache_service,
+        ):
+            response = client.get("/api/v1/items")
+            client.post("/api/v1/items", json=sample_item)
+            changed = client.get("/api/v1/items")
+
+        assert response.content == body.encode()
+        assert response.headers["etag"] == etag
+        assert changed.json()["total"] == 1
+        assert changed.headers["etag"] != etag
+        read_keys = [c.args[0] for c in mock_cache_service.get.await_args_list]
+        assert read_keys.count(old_key) == 1
+
     def test_list_items_invalid_page(self, client: TestClient) -> None:
         """Test invalid page number."""
         response = client.get("/api/v1/items?page=0")
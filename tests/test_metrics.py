@@ -4,97 +4,123 @@ Tests cover:
 - Prometheus metrics endpoint
 - Metric format validation
 - Custom business metrics
+
+Live requests go through the in-process ASGI transport (async_client)
+rather than TestClient, avoiding its per-request thread portal.
 """
 
+import asyncio
+
 import pytest
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
+from prometheus_client.parser import text_string_to_metric_families
 
 
-class TestMetricsEndpoint:
-    """Tests for the Prometheus metrics endpoint."""
+def _series_labels(body: bytes, metric: bytes) -> list[dict[bytes, bytes]]:
+    """Return the label set of every series of a metric in a scrape.
 
-    def test_metrics_endpoint_returns_prometheus_format(
-        self, client: TestClient
-    ) -> None:
-        """Test that metrics endpoint returns Prometheus format."""
-        response = client.get("/metrics")
+    Walks the body with ``bytes.find`` only. A label block ends at the
+    first ``"}``, since values such as route templates may contain braces.
+    """
+    prefix = metric + b"{"
+    series = []
+    start = body.find(prefix)
+    while start != -1:
+        start += len(prefix)
+        end = body.find(b'"}', start)
+        pairs = (pair.split(b'="', 1) for pair in body[start:end].split(b'",'))
+        series.append(dict(pairs))
+        start = body.find(prefix, end)
+    return series
 
-        assert response.status_code == 200
-        assert "text/plain" in response.headers["content-type"]
 
-    def test_metrics_contains_http_request_metrics(
-        self, client: TestClient
-    ) -> None:
-        """Test that metrics include HTTP request counters."""
-        # Make a request to generate metrics
-        client.get("/healthz")
+def _sample_value(body: bytes, sample: str, labels: dict[str, str]) -> float:
+    """Return the value of the sample matching name and labels (0 if absent)."""
+    for family in text_string_to_metric_families(body.decode("ascii")):
+        for s in family.samples:
+            if s.name == sample and labels.items() <= s.labels.items():
+                return s.value
+    return 0.0
 
-        response = client.get("/metrics")
-        content = response.text
 
-        # Check for expected metric names
-        assert "http_requests_total" in content
-        assert "http_request_duration_seconds" in content
+class TestMetricsEndpoint:
+    """Tests for the Prometheus metrics endpoint."""
 
-    def test_metrics_contains_custom_business_metrics(
-        self, client: TestClient
+    async def test_metrics_endpoint_returns_prometheus_format(
+        self, async_client: AsyncClient
     ) -> None:
-        """Test that metrics include custom business metrics."""
-        response = client.get("/metrics")
-        content = response.text
-
-        # Check for business metrics (may be 0 initially)
-        assert "cache_hits_total" in content
-        assert "cache_misses_total" in content
-        assert "items_created_total" in content
-        assert "items_deleted_total" in content
-
-    def test_metrics_increments_after_requests(
-        self, client: TestClient
+        """Test that metrics endpoint returns Prometheus format."""
+        # Only the headers matter here, so never read the body
+        async with async_client.stream("GET", "/metrics") as response:
+            assert response.status_code == 200
+            assert "text/plain" in response.headers["content-type"]
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "http_requests_total",
+            "http_request_duration_seconds",
+            "cache_hits_total",
+            "cache_misses_total",
+            "items_created_total",
+            "items_deleted_total",
+        ],
+    )
+    def test_metric_exists(self, metric_names: frozenset[str], name: str) -> None:
+        """Test that HTTP and business metrics are exposed (may be 0 initially)."""
+        assert name in metric_names
+
+    async def test_metrics_increments_after_requests(
+        self, async_client: AsyncClient
     ) -> None:
         """Test that metrics increment after requests."""
-        # Get initial metrics
-        initial_response = client.get("/metrics")
-        initial_content = initial_response.text
+        labels = {"method": "GET", "endpoint": "/healthz", "status_class": "2xx"}
 
-        # Make some requests
-        for _ in range(3):
-            client.get("/healthz")
+        # Get initial count
+        response = await async_client.get("/metrics")
+        before = _sample_value(response.content, "http_requests_total", labels)
 
-        # Get updated metrics
-        updated_response = client.get("/metrics")
-        updated_content = updated_response.text
+        # Make some concurrent requests, building the request only once
+        request = async_client.build_request("GET", "/healthz")
+        await asyncio.gather(*(async_client.send(request) for _ in range(3)))
 
-        # Verify metrics were recorded
-        assert "http_requests_total" in updated_content
+        # Verify every request was counted
+        response = await async_client.get("/metrics")
+        after = _sample_value(response.content, "http_requests_total", labels)
+        assert after >= before + 3
 
 
 class TestMetricLabels:
     """Tests for metric label correctness."""
 
-    def test_metrics_have_method_label(self, client: TestClient) -> None:
-        """Test that HTTP metrics have method label."""
-        client.get("/healthz")
-        response = client.get("/metrics")
-        content = response.text
-
-        # Should have GET method label
-        assert 'method="GET"' in content
-
-    def test_metrics_have_endpoint_label(self, client: TestClient) -> None:
-        """Test that HTTP metrics have endpoint label."""
-        client.get("/healthz")
-        response = client.get("/metrics")
-        content = response.text
-
-        # Should have healthz endpoint label
-        assert 'endpoint="/healthz"' in content
-
-    def test_metrics_have_status_code_label(self, client: TestClient) -> None:
-        """Test that HTTP metrics have status code label."""
-        client.get("/healthz")
-        response = client.get("/metrics")
-        content = response.text
+    def test_metrics_http_request_labels(self, metrics_body: bytes) -> None:
+        """Test that HTTP metrics have method, endpoint and status class labels."""
+        series = _series_labels(metrics_body, b"http_requests_total")
+
+        # Should have a GET /healthz series with 200 bucketed into 2xx
+        assert {
+            b"method": b"GET",
+            b"endpoint": b"/healthz",
+            b"status_class": b"2xx",
+        } in series
+        assert not any(b"status_code" in labels for labels in series)
+
+    async def test_metrics_use_route_template(self, async_client: AsyncClient) -> None:
+        """Test that path parameters are collapsed into the route template."""
+        await async_client.get("/api/v1/items/some-missing-id")
+        response = await async_client.get("/metrics")
+        content = response.content
+
+        assert b'endpoint="/api/v1/items/{item_id}"' in content
+        assert b"some-missing-id" not in content
+
+    async def test_metrics_collapse_unmatched_paths(
+        self, async_client: AsyncClient
+    ) -> None:
+        """Test that unknown paths share a single endpoint label."""
+        await async_client.get("/no/such/path")
+        response = await async_client.get("/metrics")
+        content = response.content
 
-        # Should have 200 status code
-        assert 'status_code="200"' in content
+        assert b'endpoint="__unmatched__"' in content
+        assert b"/no/such/path" not in content
@@ -0,0 +1,84 @@
+"""Tests for application middleware.
+
+Tests cover:
+- Request ID generation and propagation
+- Response timing header
+- Settings-driven middleware stack
+"""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.testclient import TestClient
+
+from app.api.metrics import MetricsMiddleware
+from app.core.config import settings
+from app.main import create_app
+from app.middleware.request_id import RequestIDMiddleware
+
+
+class TestRequestIDMiddleware:
+    """Tests for the request ID middleware."""
+
+    def test_generates_request_id(self, client: TestClient) -> None:
+        """Test that a request ID is generated when none is supplied."""
+        response = client.get("/healthz")
+
+        assert response.status_code == 200
+        request_id = response.headers["x-request-id"]
+        assert len(request_id) == 32
+        int(request_id, 16)  # hex-encoded UUID4
+
+    def test_propagates_incoming_request_id(self, client: TestClient) -> None:
+        """Test that an incoming X-Request-ID header is echoed back."""
+        response = client.get("/healthz", headers={"X-Request-ID": "trace-123"})
+
+        assert response.headers["x-request-id"] == "trace-123"
+
+    def test_adds_response_time_header(self, client: TestClient) -> None:
+        """Test that the response time header is present and formatted."""
+        response = client.get("/healthz")
+
+        assert response.headers["x-response-time"].endswith("ms")
+
+
+class TestMiddlewareStack:
+    """Tests for settings-driven middleware installation."""
+
+    def test_default_stack(self) -> None:
+        """Test that all middleware is installed with default settings."""
+        app = create_app()
+        installed = {m.cls for m in app.user_middleware}
+
+        assert installed == {RequestIDMiddleware, MetricsMiddleware, CORSMiddleware}
+
+    @pytest.mark.parametrize(
+        "origins", [["*"], ["*", "https://example.com"]], ids=["only", "mixed"]
+    )
+    def test_wildcard_cors_disallows_credentials(self, origins: list[str]) -> None:
+        """Test that a wildcard origin is never combined with credentials."""
+        with patch.object(settings, "cors_origins", origins):
+            app = create_app()
+        cors = next(m for m in app.user_middleware if m.cls is CORSMiddleware)
+
+        assert cors.kwargs["allow_credentials"] is False
+
+    def test_explicit_cors_origins_allow_credentials(self) -> None:
+        """Test that credentials are allowed for an exact origin list."""
+        with patch.object(settings, "cors_origins", ["https://example.com"]):
+            app = create_app()
+        cors = next(m for m in app.user_middleware if m.cls is CORSMiddleware)
+
+        assert cors.kwargs["allow_credentials"] is True
+
+    def test_optional_middleware_can_be_disabled(self) -> None:
+        """Test that metrics and CORS middleware are skipped when disabled."""
+        with (
+            patch.object(settings, "metrics_enabled", False),
+            patch.object(settings, "cors_origins", []),
+        ):
+            app = create_app()
+        installed = {m.cls for m in app.user_middleware}
+
+        assert installed == {RequestIDMiddleware}